@@ -1,11 +1,26 @@
-from ast import Tuple
-from typing import Literal
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Literal, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from config import FORECAST_PARAMS_FILE
+
 
 ProjectMethod = Literal["last", "linear"]
+Backend = Literal["prophet", "linear"]
+
+# Used by the UI until a backtest has persisted tuned parameters.
+DEFAULT_FORECAST_PARAMS = {
+    "backend": "prophet",
+    "n_changepoints": 20,
+    "changepoint_prior_scale": 0.5,
+}
 
 # Try importing Prophet (friendly error if missing)
 try:
@@ -32,6 +47,53 @@ def _project_regressor_series(series: pd.Series, periods: int, method: ProjectMe
     x_future = np.arange(len(series), len(series) + periods)
     return m * x_future + b
 
+def _monthly_networth(df: pd.DataFrame) -> pd.Series:
+    return df.resample("MS").ffill()["NetWorth"]
+
+
+def _linear_forecast(history: pd.Series, periods: int, interval_width: float = 0.95) -> pd.DataFrame:
+    """
+    Straight-line baseline with the same output columns as Prophet.predict
+    (ds, yhat, yhat_lower, yhat_upper), covering history plus `periods` months.
+    Intervals come from the residual spread, assuming normal errors.
+    """
+    history = history.dropna()
+    x = np.arange(len(history))
+    y = history.values.astype(float)
+    if len(history) > 1:
+        m, b = np.polyfit(x, y, 1)
+    else:
+        m, b = 0.0, (y[0] if len(y) else 0.0)
+    x_all = np.arange(len(history) + periods)
+    yhat = m * x_all + b
+    resid_std = np.std(y - (m * x + b), ddof=1) if len(history) > 2 else 0.0
+    z = NormalDist().inv_cdf(0.5 + interval_width / 2)
+    ds = pd.date_range(start=history.index[0], periods=len(x_all), freq="MS")
+    return pd.DataFrame({
+        "ds": ds,
+        "yhat": yhat,
+        "yhat_lower": yhat - z * resid_std,
+        "yhat_upper": yhat + z * resid_std,
+    })
+
+
+def _make_prophet(
+    n_changepoints: int,
+    changepoint_prior_scale: float,
+    interval_width: float,
+    use_yearly_seasonality: bool = False
+):
+    return Prophet(
+        growth="linear",
+        yearly_seasonality=use_yearly_seasonality,
+        weekly_seasonality=False,
+        daily_seasonality=False,
+        n_changepoints=n_changepoints,
+        changepoint_prior_scale=changepoint_prior_scale,
+        interval_width=interval_width
+    )
+
+
 def build_monthly_forecast_from_now(
     df: pd.DataFrame,
     months_ahead: int = 9,
@@ -39,23 +101,20 @@ def build_monthly_forecast_from_now(
     n_changepoints: int = 50,
     changepoint_prior_scale: float = 0.05,
     interval_width: float = 0.95,
-    use_yearly_seasonality: bool = False
-) -> Tuple[Prophet, pd.DataFrame, pd.DataFrame]:
+    use_yearly_seasonality: bool = False,
+    backend: Backend = "prophet"
+) -> Tuple[Optional["Prophet"], pd.DataFrame, pd.DataFrame]:
     
     monthly = df.resample("MS").ffill()[["NetWorth"]]
     history = monthly.copy()
+
+    if backend == "linear":
+        forecast = _linear_forecast(history["NetWorth"], months_ahead, interval_width)
+        return None, forecast[["ds"]], forecast
     
     prophet_train = pd.DataFrame({"ds": history.index, "y": history["NetWorth"].values})
     
-    m = Prophet(
-        growth="linear",
-        yearly_seasonality=use_yearly_seasonality,
-        weekly_seasonality=False,
-        daily_seasonality=False,
-        n_changepoints=n_changepoints,
-        changepoint_prior_scale=changepoint_prior_scale,
-        interval_width=interval_width
-    )
+    m = _make_prophet(n_changepoints, changepoint_prior_scale, interval_width, use_yearly_seasonality)
     m.fit(prophet_train)
 
     future_df = m.make_future_dataframe(periods=months_ahead, freq="MS")
@@ -78,3 +137,148 @@ def build_monthly_forecast_from_now(
     last_forecast = forecast.loc[match_idx, 'yhat']
     bias = last_actual - last_forecast
     return m, future_df, forecast
+
+
+# ---------------------------------------------------------------
+# BACKTESTING / HYPERPARAMETER SWEEP
+# ---------------------------------------------------------------
+
+def default_param_grid() -> List[Dict[str, object]]:
+    grid = [{"backend": "linear"}]
+    if Prophet is not None:
+        grid += [
+            {"backend": "prophet", "n_changepoints": n, "changepoint_prior_scale": cps}
+            for n in (5, 10, 20, 50)
+            for cps in (0.01, 0.05, 0.1, 0.5)
+        ]
+    return grid
+
+
+def _fit_predict(train: pd.Series, horizon: int, config: Dict[str, object], interval_width: float) -> pd.DataFrame:
+    if config.get("backend", "prophet") == "linear":
+        forecast = _linear_forecast(train, horizon, interval_width)
+    else:
+        m = _make_prophet(int(config["n_changepoints"]), config["changepoint_prior_scale"], interval_width)
+        m.fit(pd.DataFrame({"ds": train.index, "y": train.values}))
+        forecast = m.predict(m.make_future_dataframe(periods=horizon, freq="MS"))
+    return forecast.tail(horizon)
+
+
+def _backtest_config(
+    series: pd.Series,
+    config: Dict[str, object],
+    cutoffs: List[int],
+    horizon: int,
+    interval_width: float
+) -> Dict[str, object]:
+    """Rolling-origin evaluation of one configuration (runs in a worker process)."""
+    errors, covered, fit_times = [], [], []
+    for cutoff in cutoffs:
+        train = series.iloc[:cutoff]
+        actual = series.iloc[cutoff:cutoff + horizon].values
+        start = time.perf_counter()
+        forecast = _fit_predict(train, horizon, config, interval_width)
+        fit_times.append(time.perf_counter() - start)
+
+        n = min(len(actual), len(forecast))
+        actual = actual[:n]
+        yhat = forecast["yhat"].values[:n]
+        nonzero = actual != 0
+        errors.append(np.abs((actual[nonzero] - yhat[nonzero]) / actual[nonzero]))
+        covered.append((actual >= forecast["yhat_lower"].values[:n]) & (actual <= forecast["yhat_upper"].values[:n]))
+
+    errors = np.concatenate(errors) if errors else np.array([])
+    covered = np.concatenate(covered) if covered else np.array([])
+    return {
+        **config,
+        "mape": errors.mean() * 100 if errors.size else np.nan,
+        "coverage": covered.mean() if covered.size else np.nan,
+        "fit_seconds": float(np.mean(fit_times)) if fit_times else np.nan,
+    }
+
+
+def backtest_forecast(
+    df: pd.DataFrame,
+    param_grid: Optional[List[Dict[str, object]]] = None,
+    horizon: int = 3,
+    n_cutoffs: int = 6,
+    min_train: int = 12,
+    interval_width: float = 0.95,
+    max_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Rolling-origin backtest of every configuration in `param_grid` on the
+    monthly NetWorth series: each of the last `n_cutoffs` origins trains on
+    everything before it and forecasts `horizon` months. Configurations are
+    evaluated in parallel worker processes. Returns one row per configuration
+    with MAPE (%), interval coverage and mean fit time, best MAPE first.
+    """
+    series = _monthly_networth(df).dropna()
+    grid = param_grid or default_param_grid()
+
+    last_cutoff = len(series) - horizon
+    first_cutoff = max(min_train, last_cutoff - n_cutoffs + 1)
+    cutoffs = list(range(first_cutoff, last_cutoff + 1))
+    if not cutoffs:
+        raise ValueError(
+            f"Need at least {min_train + horizon} months of history to backtest, got {len(series)}."
+        )
+
+    workers = max_workers or min(len(grid), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_backtest_config, series, config, cutoffs, horizon, interval_width)
+            for config in grid
+        ]
+        results = [future.result() for future in futures]
+
+    return (
+        pd.DataFrame(results)
+        .sort_values(["mape", "coverage", "fit_seconds"], ascending=[True, False, True])
+        .reset_index(drop=True)
+    )
+
+
+def save_best_params(
+    results: pd.DataFrame,
+    file_path: Path = FORECAST_PARAMS_FILE,
+    min_coverage: float = 0.8
+) -> Dict[str, object]:
+    """
+    Persists the lowest-MAPE configuration whose intervals covered at least
+    `min_coverage` of the actuals (ties broken on coverage, then fit time).
+    When none qualifies, the best-covering configuration is kept instead.
+    """
+    eligible = results[results["coverage"] >= min_coverage]
+    if eligible.empty:
+        eligible = results.sort_values(["coverage", "mape"], ascending=[False, True])
+    best = eligible.iloc[0].dropna().to_dict()
+    params = {k: v.item() if isinstance(v, np.generic) else v for k, v in best.items()}
+    file_path.write_text(json.dumps(params, indent=2), encoding="utf-8")
+    return params
+
+
+def load_best_params(file_path: Path = FORECAST_PARAMS_FILE) -> Dict[str, object]:
+    """Tuned forecast parameters from the last backtest, or the defaults."""
+    params = dict(DEFAULT_FORECAST_PARAMS)
+    if file_path.exists():
+        saved = json.loads(file_path.read_text(encoding="utf-8"))
+        params.update({k: saved[k] for k in ("backend", "n_changepoints", "changepoint_prior_scale") if k in saved})
+    params["n_changepoints"] = int(params["n_changepoints"])
+    params["changepoint_prior_scale"] = float(params["changepoint_prior_scale"])
+    if params["backend"] == "prophet" and Prophet is None:
+        params["backend"] = "linear"
+    return params
+
+
+if __name__ == "__main__":
+    # python -m analytics.forecast [excel_file]
+    import sys
+
+    from config import EXCEL_FILE
+    from data.loader import fx_rates_version, load_finance_data
+
+    excel_file = Path(sys.argv[1]) if len(sys.argv) > 1 else EXCEL_FILE
+    results = backtest_forecast(load_finance_data(excel_file, fx_rates_version()))
+    print(results.to_string(index=False))
+    print(f"Best configuration saved to {FORECAST_PARAMS_FILE}: {save_best_params(results)}")
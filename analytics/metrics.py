@@ -0,0 +1,117 @@
+# ---------------------------------------------------------------
+# RUNNING / ROLLING METRICS
+# ---------------------------------------------------------------
+# All kernels work on a (periods x accounts) array at once, using
+# cumulative max / cumsum passes so every account costs O(n).
+import numpy as np
+import pandas as pd
+
+
+# Display formats for the get_account_metrics columns that need one.
+METRIC_FORMATS = {
+    "max_drawdown": "{:.1%}",
+    "volatility": "€{:,.2f}",
+    "cagr": "{:.1%}",
+    "contribution_share": "{:.1%}",
+}
+
+
+def _balance_columns(df: pd.DataFrame):
+    return [col for col in df.columns if "_Change" not in col]
+
+
+def _monthly_balances(df: pd.DataFrame) -> pd.DataFrame:
+    cols = _balance_columns(df)
+    return df[cols].sort_index().resample("ME").last().ffill()
+
+
+def _run_lengths(mask: np.ndarray) -> np.ndarray:
+    """Length of the current run of True values at each row, per column."""
+    counts = np.cumsum(mask, axis=0)
+    # Freeze the running count at every False row, then subtract it back out.
+    resets = np.maximum.accumulate(np.where(mask, 0, counts), axis=0)
+    return counts - resets
+
+
+def drawdown_kernel(values: np.ndarray):
+    """
+    Returns (max_drawdown, longest_duration) per column. Drawdown is the
+    fractional drop from the running peak; duration counts consecutive
+    periods spent below that peak. NaNs never set a new peak.
+    """
+    peaks = np.fmax.accumulate(np.where(np.isnan(values), -np.inf, values), axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peaks > 0, values / peaks - 1.0, np.nan)
+    max_drawdown = np.nanmin(np.where(np.isnan(drawdown), np.inf, drawdown), axis=0)
+    max_drawdown = np.where(np.isinf(max_drawdown), np.nan, max_drawdown)
+    duration = _run_lengths(np.nan_to_num(drawdown, nan=0.0) < 0).max(axis=0, initial=0)
+    return max_drawdown, duration
+
+
+def streak_kernel(changes: np.ndarray):
+    """Returns (longest, current) streak of strictly positive changes per column."""
+    runs = _run_lengths(np.nan_to_num(changes, nan=0.0) > 0)
+    current = runs[-1] if len(runs) else np.zeros(changes.shape[1], dtype=int)
+    return runs.max(axis=0, initial=0), current
+
+
+def cagr_kernel(values: np.ndarray, index: pd.DatetimeIndex) -> np.ndarray:
+    """Compound annual growth rate between each column's first and last valid value."""
+    valid = ~np.isnan(values)
+    has_data = valid.any(axis=0)
+    first_pos = valid.argmax(axis=0)
+    last_pos = len(values) - 1 - valid[::-1].argmax(axis=0)
+    cols = np.arange(values.shape[1])
+    first = values[first_pos, cols]
+    last = values[last_pos, cols]
+
+    dates = index.values
+    years = (dates[last_pos] - dates[first_pos]) / np.timedelta64(1, "D") / 365.25
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr = np.power(last / first, 1.0 / years) - 1.0
+    ok = has_data & (years > 0) & (first > 0) & (last > 0)
+    return np.where(ok, cagr, np.nan)
+
+
+def rolling_volatility(df: pd.DataFrame, window: int = 12) -> pd.DataFrame:
+    """Rolling standard deviation of monthly changes for every account and NetWorth."""
+    changes = _monthly_balances(df).diff()
+    return changes.rolling(window, min_periods=2).std()
+
+
+def get_account_metrics(df: pd.DataFrame, window: int = 12) -> pd.DataFrame:
+    """
+    One row per account (plus NetWorth) with max drawdown and its duration,
+    latest rolling volatility of monthly changes, CAGR, positive-month streaks
+    and each account's share of the total change across accounts.
+    """
+    monthly = _monthly_balances(df)
+    values = monthly.to_numpy(dtype=float)
+    changes = np.diff(values, axis=0, prepend=np.nan)
+
+    max_dd, dd_duration = drawdown_kernel(values)
+    longest, current = streak_kernel(changes)
+    cagr = cagr_kernel(values, monthly.index)
+    volatility = rolling_volatility(df, window).iloc[-1].to_numpy(dtype=float)
+
+    # Each account contributes its growth since the start of the history; an
+    # account opened later contributes its whole balance. Shares are taken of
+    # the accounts' combined contribution so they always add up to 1.
+    contribution = np.nan_to_num(values[-1]) - np.nan_to_num(values[0]) if len(values) else np.zeros(values.shape[1])
+    is_account = np.asarray(monthly.columns != "NetWorth")
+    total = contribution[is_account].sum()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(is_account, contribution, total) / total if total else np.full(len(contribution), np.nan)
+
+    return pd.DataFrame(
+        {
+            "max_drawdown": max_dd,
+            "drawdown_months": dd_duration,
+            "volatility": volatility,
+            "cagr": cagr,
+            "longest_positive_streak": longest,
+            "current_positive_streak": current,
+            "contribution_share": share,
+        },
+        index=monthly.columns,
+    )
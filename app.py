@@ -1,21 +1,44 @@
 import streamlit as st
-from data.loader import load_finance_data, EXCEL_FILE
+from config import WATCH_EXCEL_FILE, WATCH_INTERVAL_SECONDS
+from data.loader import load_finance_data_with_issues, fx_rates_version, EXCEL_FILE
+from data.watcher import get_workbook_watcher
 from analytics.stats import get_statistics
-from ui import tab_dashboard, tab_actual_vs_expected, tab_savings_goal
+from ui import tab_dashboard, tab_actual_vs_expected, tab_savings_goal, tab_snapshot
 
 st.set_page_config(page_title="Finance Dashboard", page_icon="💰", layout="wide")
 st.title("💰 Personal Finance Dashboard")
 st.markdown("Track each account and your net worth over time.")
 
+# Read-only viewers (?view=snapshot) get the precomputed snapshot from snapshot.py
+if st.query_params.get("view") == "snapshot":
+    tab_snapshot.render()
+    st.stop()
+
 uploaded_file = st.file_uploader("Upload your Excel file", type=["xlsx"])
 if uploaded_file:
-    df = load_finance_data(uploaded_file)
+    df, issues = load_finance_data_with_issues(uploaded_file, fx_rates_version())
+elif EXCEL_FILE.exists() and WATCH_EXCEL_FILE:
+    watcher = get_workbook_watcher(EXCEL_FILE)
+    st.session_state["workbook_version"] = watcher.version
+    df, issues = load_finance_data_with_issues(EXCEL_FILE, fx_rates_version(), watcher.version)
+
+    # Cheap per-session check; the reload itself already ran once on the watcher thread
+    @st.fragment(run_every=WATCH_INTERVAL_SECONDS)
+    def _refresh_on_change():
+        if watcher.version != st.session_state.get("workbook_version"):
+            st.rerun()
+
+    _refresh_on_change()
 elif EXCEL_FILE.exists():
-    df = load_finance_data(EXCEL_FILE)
+    df, issues = load_finance_data_with_issues(EXCEL_FILE, fx_rates_version())
 else:
     st.warning("Please upload an Excel file to continue.")
     st.stop()
 
+if not issues.empty:
+    with st.expander(f"⚠️ {len(issues)} data issues found in the workbook"):
+        st.dataframe(issues, use_container_width=True)
+
 stats = get_statistics(df)
 
 tab1, tab2, tab3 = st.tabs(["Dashboard", "Actual vs Expected", "Savings Goal"])
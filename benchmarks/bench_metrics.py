@@ -0,0 +1,155 @@
+# ---------------------------------------------------------------
+# METRICS KERNELS: CORRECTNESS + BENCHMARK
+# ---------------------------------------------------------------
+"""
+Checks the vectorized kernels in analytics.metrics against straightforward
+per-account loops, then times both on a wide synthetic history.
+
+    python -m benchmarks.bench_metrics [--months 600] [--accounts 50]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from analytics.metrics import (
+    _run_lengths,
+    cagr_kernel,
+    drawdown_kernel,
+    get_account_metrics,
+    streak_kernel,
+)
+
+
+def synthetic_balances(months: int, accounts: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk balances; some accounts open late and some have gaps."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2000-01-31", periods=months, freq="ME")
+    values = 1000 + np.cumsum(rng.normal(20, 150, size=(months, accounts)), axis=0)
+    values = np.abs(values)
+    for col in range(0, accounts, 5):
+        values[: rng.integers(1, months // 2), col] = np.nan  # opened later
+    gaps = rng.random(values.shape) < 0.02
+    values[gaps] = np.nan
+    return pd.DataFrame(values, index=index, columns=[f"Account{i}" for i in range(accounts)])
+
+
+def finance_frame(balances: pd.DataFrame) -> pd.DataFrame:
+    df = balances.copy()
+    df["NetWorth"] = df.sum(axis=1, min_count=1)
+    changes = df.diff()
+    changes.columns = [f"{col}_Change" for col in df.columns]
+    return pd.concat([df, changes], axis=1)
+
+
+# --- Reference implementations (one account at a time) ---
+
+def ref_run_lengths(mask: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(mask), dtype=int)
+    run = 0
+    for i, flag in enumerate(mask):
+        run = run + 1 if flag else 0
+        out[i] = run
+    return out
+
+
+def ref_drawdown(series: pd.Series):
+    peak = series.cummax()
+    drawdown = (series / peak - 1.0).where(peak > 0)
+    below = (drawdown.fillna(0) < 0).to_numpy()
+    return drawdown.min(), ref_run_lengths(below).max(initial=0)
+
+
+def ref_streak(changes: pd.Series):
+    runs = ref_run_lengths((changes.fillna(0) > 0).to_numpy())
+    return runs.max(initial=0), runs[-1]
+
+
+def ref_cagr(series: pd.Series) -> float:
+    valid = series.dropna()
+    if len(valid) < 2 or valid.iloc[0] <= 0 or valid.iloc[-1] <= 0:
+        return np.nan
+    years = (valid.index[-1] - valid.index[0]).days / 365.25
+    return (valid.iloc[-1] / valid.iloc[0]) ** (1 / years) - 1
+
+
+def check_kernels(balances: pd.DataFrame):
+    values = balances.to_numpy(dtype=float)
+    changes = np.diff(values, axis=0, prepend=np.nan)
+
+    mask = np.random.default_rng(1).random(values.shape) < 0.6
+    runs = _run_lengths(mask)
+    for col in range(mask.shape[1]):
+        np.testing.assert_array_equal(runs[:, col], ref_run_lengths(mask[:, col]))
+
+    max_dd, duration = drawdown_kernel(values)
+    longest, current = streak_kernel(changes)
+    cagr = cagr_kernel(values, balances.index)
+    for col, name in enumerate(balances.columns):
+        exp_dd, exp_duration = ref_drawdown(balances[name])
+        np.testing.assert_allclose(max_dd[col], exp_dd, err_msg=f"max_drawdown {name}")
+        assert duration[col] == exp_duration, f"drawdown duration {name}"
+
+        exp_longest, exp_current = ref_streak(pd.Series(changes[:, col]))
+        assert (longest[col], current[col]) == (exp_longest, exp_current), f"streaks {name}"
+
+        np.testing.assert_allclose(cagr[col], ref_cagr(balances[name]), err_msg=f"cagr {name}")
+
+    # Drawdown of a known path: peak 100 -> 60 (-40%) over three periods, then recovery
+    dd, dur = drawdown_kernel(np.array([[50.0], [100.0], [80.0], [60.0], [90.0], [120.0]]))
+    np.testing.assert_allclose(dd, [-0.4])
+    assert dur[0] == 3
+
+    metrics = get_account_metrics(finance_frame(balances))
+    accounts = metrics.drop(index="NetWorth")
+    np.testing.assert_allclose(accounts["contribution_share"].sum(), 1.0)
+
+
+def reference_metrics(balances: pd.DataFrame) -> pd.DataFrame:
+    rows = {}
+    for name in balances.columns:
+        series = balances[name].ffill()
+        changes = series.diff()
+        dd, duration = ref_drawdown(series)
+        longest, current = ref_streak(changes)
+        rows[name] = {
+            "max_drawdown": dd,
+            "drawdown_months": duration,
+            "volatility": changes.rolling(12, min_periods=2).std().iloc[-1],
+            "cagr": ref_cagr(series),
+            "longest_positive_streak": longest,
+            "current_positive_streak": current,
+        }
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--months", type=int, default=600)
+    parser.add_argument("--accounts", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    check_kernels(synthetic_balances(120, 12))
+    print("Kernels match the per-account reference implementations.")
+
+    balances = synthetic_balances(args.months, args.accounts)
+    df = finance_frame(balances)
+    vectorized = best_of(lambda: get_account_metrics(df))
+    looped = best_of(lambda: reference_metrics(balances))
+    print(f"{args.accounts} accounts x {args.months} months")
+    print(f"  get_account_metrics (vectorized): {vectorized * 1000:8.1f} ms")
+    print(f"  per-account pandas loop:          {looped * 1000:8.1f} ms  ({looped / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
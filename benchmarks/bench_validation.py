@@ -0,0 +1,160 @@
+# ---------------------------------------------------------------
+# INGESTION VALIDATION: CORRECTNESS + BENCHMARK
+# ---------------------------------------------------------------
+"""
+Checks data.validation on hand-built cases, then writes a large synthetic
+workbook and times parsing it against the validation pass run on load.
+
+    python -m benchmarks.bench_validation [--sheets 20] [--rows 2000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.loader import READ_EXCEL_OPTIONS
+from data.validation import EXCEL_ERROR, build_report, check_sheet, detect_outlier_jumps
+
+# Text and error-cell values a hand-kept workbook typically holds instead of a number
+BAD_BALANCES = ["n/a", "NA", "#N/A", "abc"]
+
+
+def _parse(raw: pd.DataFrame):
+    return pd.to_datetime(raw["Date"], errors="coerce"), pd.to_numeric(raw["Balance"], errors="coerce")
+
+
+def read_workbook(path: Path) -> dict:
+    """Reads sheets exactly as load_finance_data_with_issues does."""
+    return pd.read_excel(path, sheet_name=None, **READ_EXCEL_OPTIONS)
+
+
+def check_sheet_issues():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "issues.xlsx"
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            pd.DataFrame({
+                "Date": ["2024-01-01", "2024-02-01", "2024-02-01", "2024-01-15",
+                         "2024-03-01", "2024-04-01", "2024-05-01", "2024-06-01", "not a date"],
+                "Balance": [100, "n/a", 120, 130, "NA", "#N/A", None, "abc", 140],
+            }).to_excel(writer, sheet_name="Checking", index=False)
+            pd.DataFrame({
+                "Date": pd.date_range("2024-01-01", periods=5, freq="MS"), "Balance": [1, 2, None, 4, 5],
+            }).to_excel(writer, sheet_name="Clean", index=False)
+        sheets = read_workbook(path)
+
+    raw = sheets["Checking"]
+    report = build_report(check_sheet("Checking", raw, *_parse(raw)))
+    counts = report["issue"].value_counts().to_dict()
+    assert counts == {
+        "coerced_balance": 4,  # n/a, NA, #N/A, abc; the blank cell is not an issue
+        "duplicate_date": 2,
+        "invalid_date": 1,
+        "non_monotonic_date": 1,
+    }, counts
+    coerced = report[report["issue"] == "coerced_balance"]
+    assert list(coerced["value"]) == ["n/a", "NA", EXCEL_ERROR, "abc"], coerced
+    assert coerced["date"].iloc[0] == pd.Timestamp("2024-02-01")
+
+    clean = sheets["Clean"]
+    assert build_report(check_sheet("Clean", clean, *_parse(clean))).empty
+
+
+def check_outlier_jumps():
+    rng = np.random.default_rng(0)
+    dates_a = pd.date_range("2020-01-01", periods=40, freq="28D")
+    dates_b = dates_a + pd.Timedelta(days=14)  # interleaved with A
+    a = pd.Series(10000 + np.cumsum(rng.normal(100, 50, 40)), index=dates_a)
+    b = pd.Series(5000 + np.cumsum(rng.normal(50, 30, 40)), index=dates_b)
+    a.iloc[30:] += 20000
+    b.iloc[25:] += 20000
+    merged = pd.concat({"A": a, "B": b}, axis=1).sort_index()
+    report = detect_outlier_jumps(merged)
+    assert list(zip(report["account"], report["date"])) == [("A", dates_a[30]), ("B", dates_b[25])], report
+
+    # Constant changes (MAD of 0) must still flag a jump, but not the steady rows
+    steady = pd.Series(1000 + 500 * np.arange(40.0), index=dates_a)
+    steady.iloc[30:] += 20000
+    dormant = pd.Series(5000.0, index=dates_a)
+    dormant.iloc[20:] += 3000
+    report = detect_outlier_jumps(pd.concat({"Steady": steady, "Dormant": dormant}, axis=1))
+    assert list(zip(report["account"], report["date"])) == [("Dormant", dates_a[20]), ("Steady", dates_a[30])], report
+
+    # Ordinary noise is rarely flagged (a 12-period MAD is itself noisy)
+    noise = pd.DataFrame(10000 + np.cumsum(rng.normal(0, 100, size=(500, 5)), axis=0),
+                         index=pd.date_range("2000-01-01", periods=500, freq="W"))
+    assert len(detect_outlier_jumps(noise)) < 0.005 * noise.size
+
+
+def write_workbook(path: Path, sheets: int, rows: int, seed: int = 0) -> int:
+    """Writes a synthetic workbook and returns how many bad balances it holds."""
+    rng = np.random.default_rng(seed)
+    n_bad = 0
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for i in range(sheets):
+            start = pd.Timestamp("2000-01-01") + pd.Timedelta(days=int(rng.integers(0, 7)))
+            balance = (5000 + np.cumsum(rng.normal(10, 200, rows))).round(2).astype(object)
+            bad = np.flatnonzero(rng.random(rows) < 0.001)
+            balance[bad] = [BAD_BALANCES[j % len(BAD_BALANCES)] for j in range(len(bad))]
+            n_bad += len(bad)
+            sheet = pd.DataFrame({"Date": pd.date_range(start, periods=rows, freq="D"), "Balance": balance})
+            sheet.to_excel(writer, sheet_name=f"Account{i}", index=False)
+    return n_bad
+
+
+def prepare(all_sheets: dict):
+    """Coercion and merge that load_finance_data_with_issues does with or without validation."""
+    parsed = {account: _parse(raw) for account, raw in all_sheets.items()}
+    merged = pd.concat(
+        {account: pd.Series(balances.values, index=dates.values) for account, (dates, balances) in parsed.items()},
+        axis=1,
+    ).sort_index()
+    return parsed, merged
+
+
+def validate(all_sheets: dict, parsed: dict, merged: pd.DataFrame) -> pd.DataFrame:
+    """The extra work load_finance_data_with_issues does to build the issues report."""
+    found = []
+    for account, raw in all_sheets.items():
+        found.extend(check_sheet(account, raw, *parsed[account]))
+    found.append(detect_outlier_jumps(merged))
+    return build_report(found)
+
+
+def best_of(fn, repeat: int = 3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sheets", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    check_sheet_issues()
+    check_outlier_jumps()
+    print("Validation checks passed.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "synthetic.xlsx"
+        n_bad = write_workbook(path, args.sheets, args.rows)
+        parse_time, all_sheets = best_of(lambda: read_workbook(path), repeat=1)
+
+    parsed, merged = prepare(all_sheets)
+    validate_time, report = best_of(lambda: validate(all_sheets, parsed, merged))
+    n_coerced = int((report["issue"] == "coerced_balance").sum())
+    assert n_coerced == n_bad, f"{n_coerced} coerced balances reported, {n_bad} injected"
+    print(f"{args.sheets} sheets x {args.rows} rows, {len(report)} issues found ({n_coerced} coerced balances)")
+    print(f"  parse (pd.read_excel): {parse_time * 1000:9.1f} ms")
+    print(f"  validation pass:       {validate_time * 1000:9.1f} ms  ({validate_time / parse_time:.1%} of parse)")
+
+
+if __name__ == "__main__":
+    main()
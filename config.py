@@ -1,6 +1,22 @@
 
-from click import Path
+from pathlib import Path
 
 
 EXCEL_FILE = Path("test.xlsx")
-TREND_COLOR = "#e75480"  # pinky-reddish for trend / forecast
\ No newline at end of file
+SNAPSHOT_DIR = Path("snapshot")
+TREND_COLOR = "#e75480"  # pinky-reddish for trend / forecast
+
+# Multi-currency: every balance is converted into BASE_CURRENCY before summing.
+# Sheets not listed in ACCOUNT_CURRENCIES are assumed to be in BASE_CURRENCY.
+BASE_CURRENCY = "EUR"
+ACCOUNT_CURRENCIES = {}  # e.g. {"Brokerage": "USD", "Pension": "CHF"}
+# CSV with Date, Currency, Rate columns; Rate = units of BASE_CURRENCY per unit of Currency.
+FX_RATES_FILE = Path("fx_rates.csv")
+
+# Best forecast configuration found by `python -m analytics.forecast`.
+FORECAST_PARAMS_FILE = Path("forecast_params.json")
+
+# Watch mode: reload EXCEL_FILE in the background when it changes on disk.
+WATCH_EXCEL_FILE = True
+WATCH_INTERVAL_SECONDS = 2.0
+WATCH_DEBOUNCE_SECONDS = 1.0  # file must be quiet this long before reloading
@@ -2,39 +2,132 @@
 # DATA LOADING
 # ---------------------------------------------------------------
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 
+from config import ACCOUNT_CURRENCIES, BASE_CURRENCY, EXCEL_FILE, FX_RATES_FILE
+from data.validation import build_report, check_sheet, detect_outlier_jumps
+
+# No NA strings: text such as "n/a" or "NA" must reach pd.to_numeric so that
+# validation can report it. Blank cells then read as "" while Excel error
+# cells (#N/A, #VALUE!, ...) still read as NaN, so the two stay distinguishable.
+READ_EXCEL_OPTIONS = {"keep_default_na": False}
+
+
+def fx_rates_version(file_path: Path = FX_RATES_FILE) -> Optional[int]:
+    """Cache key for the FX table: its mtime, or None when there is no table."""
+    return file_path.stat().st_mtime_ns if file_path.exists() else None
+
+
+@st.cache_data
+def load_fx_rates(file_path: Path = FX_RATES_FILE, version: Optional[int] = None) -> pd.DataFrame:
+    """
+    Reads the local FX table (Date, Currency, Rate) into a wide frame with one
+    column per currency, sorted by date and forward-filled so every row holds
+    the latest known rate. `version` only exists to key the cache.
+    """
+    if version is None:
+        return pd.DataFrame()
+    rates = pd.read_csv(file_path, parse_dates=["Date"])
+    rates["Currency"] = rates["Currency"].str.upper()
+    wide = rates.pivot_table(index="Date", columns="Currency", values="Rate", aggfunc="last")
+    return wide.sort_index().ffill()
+
+
+def convert_to_base(
+    merged: pd.DataFrame,
+    currencies: Dict[str, str],
+    rates: pd.DataFrame,
+    base_currency: str = BASE_CURRENCY,
+) -> pd.DataFrame:
+    """
+    Converts every foreign-currency account column into the base currency with
+    an as-of lookup: each date uses the latest rate on or before it (dates
+    before the first rate use the earliest one). All accounts sharing a
+    currency are converted in one vectorized multiply.
+    """
+    foreign = {acc: cur.upper() for acc, cur in currencies.items()
+               if acc in merged.columns and cur.upper() != base_currency}
+    if not foreign:
+        return merged
+
+    missing = sorted(cur for cur in set(foreign.values())
+                     if cur not in rates.columns or rates[cur].isna().all())
+    if missing:
+        raise ValueError(f"No FX rates for {', '.join(missing)} in {FX_RATES_FILE}")
+
+    converted = merged.copy()
+    for cur in set(foreign.values()):
+        accounts = [acc for acc, c in foreign.items() if c == cur]
+        # As-of lookup on this currency's own rates, so another currency's
+        # earlier start date cannot land a date on a missing rate.
+        cur_rates = rates[cur].dropna()
+        positions = cur_rates.index.searchsorted(merged.index, side="right") - 1
+        positions = np.clip(positions, 0, len(cur_rates) - 1)
+        rate = cur_rates.to_numpy(dtype=float)[positions]
+        converted[accounts] = merged[accounts].to_numpy(dtype=float) * rate[:, None]
+    return converted
+
 
 @st.cache_data
-def load_finance_data(file_path: Path) -> pd.DataFrame:
+def load_finance_data_with_issues(
+    file_path: Path,
+    fx_version: Optional[int] = None,
+    file_version: Optional[str] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Reads all sheets from the Excel file and merges them into a single DataFrame.
     Missing balances stay as NaN (ignored in sums).
+    Balances in other currencies (see config.ACCOUNT_CURRENCIES) are converted
+    to the base currency; pass fx_rates_version() so a new rate table busts the cache.
+    file_version (e.g. the watcher's content digest) likewise keys the cache
+    on the workbook's content rather than its path.
     Adds NetWorth and per-account MonthlyChange.
     Expects each sheet to have Date and Balance columns.
+
+    Also returns an issues report (see data.validation): unparseable dates and
+    balances, duplicate or out-of-order dates and outlier jumps. Rows with
+    invalid dates are dropped and duplicate dates keep their last row.
     """
-    all_sheets = pd.read_excel(file_path, sheet_name=None)
+    all_sheets = pd.read_excel(file_path, sheet_name=None, **READ_EXCEL_OPTIONS)
     df_list = []
+    found = []
+
+    for account, raw in all_sheets.items():
+        dates = pd.to_datetime(raw["Date"], errors="coerce")
+        balances = pd.to_numeric(raw["Balance"], errors="coerce")  # NaN if not a number
+        found.extend(check_sheet(account, raw, dates, balances))
 
-    for account, data in all_sheets.items():
-        data = data.copy()
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Balance"] = pd.to_numeric(data["Balance"], errors="coerce")  # NaN if not a number
-        data.rename(columns={"Balance": account}, inplace=True)
-        df_list.append(data.set_index("Date"))
+        data = pd.DataFrame({account: balances.values}, index=pd.DatetimeIndex(dates.values, name="Date"))
+        data = data[data.index.notna()]
+        df_list.append(data[~data.index.duplicated(keep="last")])
 
     # Outer join keeps all dates across all accounts, missing values stay NaN
     merged = pd.concat(df_list, axis=1, join="outer")
+    merged.sort_index(inplace=True)
+
+    if ACCOUNT_CURRENCIES:
+        merged = convert_to_base(merged, ACCOUNT_CURRENCIES, load_fx_rates(FX_RATES_FILE, fx_version))
+
+    found.append(detect_outlier_jumps(merged))
 
     # Net worth = sum of all accounts, ignoring NaNs
     merged["NetWorth"] = merged.sum(axis=1, skipna=True, min_count=1)
 
-    merged.sort_index(inplace=True)
-
     # Monthly change per account and Net Worth
     change_df = merged.diff()
     change_df.columns = [f"{col}_Change" for col in merged.columns]
 
-    return pd.concat([merged, change_df], axis=1)
+    return pd.concat([merged, change_df], axis=1), build_report(found)
+
+
+def load_finance_data(
+    file_path: Path,
+    fx_version: Optional[int] = None,
+    file_version: Optional[str] = None,
+) -> pd.DataFrame:
+    """Same as load_finance_data_with_issues, without the issues report."""
+    return load_finance_data_with_issues(file_path, fx_version, file_version)[0]
@@ -0,0 +1,115 @@
+# ---------------------------------------------------------------
+# DATA VALIDATION
+# ---------------------------------------------------------------
+# Cheap, vectorized checks run while loading; each returns rows of a
+# compact issues report (account, date, issue, value).
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+
+ISSUE_COLUMNS = ["account", "date", "issue", "value"]
+
+# Reported value for Excel error cells, which the reader hands over as NaN.
+EXCEL_ERROR = "#error"
+
+
+def _issues(account, dates, issue: str, values) -> pd.DataFrame:
+    return pd.DataFrame({
+        "account": account,
+        "date": pd.to_datetime(dates),
+        "issue": issue,
+        "value": np.asarray(values, dtype=object),
+    }, columns=ISSUE_COLUMNS)
+
+
+def empty_report() -> pd.DataFrame:
+    return pd.DataFrame(columns=ISSUE_COLUMNS)
+
+
+def check_sheet(account: str, raw: pd.DataFrame, dates: pd.Series, balances: pd.Series) -> List[pd.DataFrame]:
+    """
+    Compares a sheet's raw cells with their parsed values: unparseable dates,
+    balances coerced to NaN, duplicate dates and dates that go backwards.
+    Expects `raw` as read with data.loader.READ_EXCEL_OPTIONS: blank cells
+    are "" and Excel error cells (#N/A, #VALUE!, ...) are NaN.
+    """
+    found = []
+
+    bad_dates = raw["Date"].ne("") & dates.isna()
+    if bad_dates.any():
+        values = raw.loc[bad_dates, "Date"].fillna(EXCEL_ERROR)
+        found.append(_issues(account, pd.NaT, "invalid_date", values))
+
+    coerced = raw["Balance"].ne("") & balances.isna()
+    if coerced.any():
+        values = raw.loc[coerced, "Balance"].fillna(EXCEL_ERROR)
+        found.append(_issues(account, dates[coerced], "coerced_balance", values))
+
+    duplicated = dates.duplicated(keep=False) & dates.notna()
+    if duplicated.any():
+        found.append(_issues(account, dates[duplicated], "duplicate_date", balances[duplicated]))
+
+    backwards = dates.diff() < pd.Timedelta(0)
+    if backwards.any():
+        found.append(_issues(account, dates[backwards], "non_monotonic_date", balances[backwards]))
+
+    return found
+
+
+def detect_outlier_jumps(
+    balances: pd.DataFrame,
+    window: int = 12,
+    threshold: float = 5.0,
+    min_mad: float = 1.0,
+    min_mad_fraction: float = 0.001,
+) -> pd.DataFrame:
+    """
+    Flags changes whose robust z-score against the account's trailing window
+    exceeds `threshold`. The score uses the rolling median and median absolute
+    deviation (MAD) of earlier changes, so a single jump cannot hide itself.
+    Each account is scored on its own observations, so accounts recorded on
+    different dates do not blank each other out. The MAD is floored at
+    `min_mad` or `min_mad_fraction` of the typical balance, whichever is
+    larger, so accounts with constant changes (dormant, standing orders)
+    still flag a jump.
+    """
+    # Left-align each account's own observations into one padded frame, so the
+    # rolling passes run over all accounts at once without NaN rows from
+    # other accounts' dates (padding only ever trails each column).
+    own = {account: balances[account].dropna() for account in balances.columns}
+    series = pd.DataFrame({account: pd.Series(s.to_numpy(dtype=float)) for account, s in own.items()})
+    if series.empty:
+        return empty_report()
+
+    changes = series.diff()
+    median = changes.rolling(window, min_periods=3).median().shift(1)
+    deviation = changes - median
+    mad = deviation.abs().rolling(window, min_periods=3).median().shift(1)
+    level = series.abs().rolling(window, min_periods=1).median().shift(1)
+    mad = mad.clip(lower=np.fmax(min_mad, min_mad_fraction * level))
+    flagged = (0.6745 * deviation.abs() / mad > threshold).to_numpy()
+
+    rows, cols = np.nonzero(flagged)
+    if not len(rows):
+        return empty_report()
+    accounts = series.columns[cols]
+    return build_report([_issues(
+        accounts,
+        [own[account].index[row] for account, row in zip(accounts, rows)],
+        "outlier_jump",
+        changes.to_numpy()[rows, cols],
+    )])
+
+
+def build_report(found: List[pd.DataFrame]) -> pd.DataFrame:
+    found = [f for f in found if not f.empty]
+    if not found:
+        return empty_report()
+    # Stitch columns directly: concat() warns on the all-NaT date column of invalid_date rows.
+    report = pd.DataFrame({
+        col: np.concatenate([f[col].to_numpy(dtype=object) for f in found]) for col in ISSUE_COLUMNS
+    })
+    report["date"] = pd.to_datetime(report["date"])
+    return report.sort_values(["account", "date"], ignore_index=True)
@@ -0,0 +1,111 @@
+# ---------------------------------------------------------------
+# WORKBOOK WATCHER
+# ---------------------------------------------------------------
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import streamlit as st
+
+from config import WATCH_DEBOUNCE_SECONDS, WATCH_INTERVAL_SECONDS
+from data.loader import fx_rates_version, load_finance_data
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(file_path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class WorkbookWatcher:
+    """
+    Polls a file's mtime on a daemon thread. Once the mtime has been stable
+    for `debounce` seconds the content is hashed, and only a new hash calls
+    `on_change(digest)` - so a burst of saves, or a save without edits,
+    triggers at most one reload. `version` is the digest of the last
+    successfully loaded content.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        on_change: Callable[[str], None],
+        interval: float = WATCH_INTERVAL_SECONDS,
+        debounce: float = WATCH_DEBOUNCE_SECONDS,
+    ):
+        self.file_path = Path(file_path)
+        self.on_change = on_change
+        self.interval = interval
+        self.debounce = debounce
+        self.version: Optional[str] = file_digest(self.file_path)
+        self._seen_mtime = self.file_path.stat().st_mtime_ns
+        self._changed_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"watch:{self.file_path.name}", daemon=True)
+
+    def start(self) -> "WorkbookWatcher":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def poll(self) -> bool:
+        """Checks the file once; returns True when a reload happened."""
+        try:
+            mtime = self.file_path.stat().st_mtime_ns
+        except OSError:
+            return False  # mid-save (editors often replace or lock the file)
+
+        if mtime != self._seen_mtime:
+            self._seen_mtime = mtime
+            self._changed_at = time.monotonic()
+            return False
+        if self._changed_at is None or time.monotonic() - self._changed_at < self.debounce:
+            return False
+        self._changed_at = None
+
+        try:
+            digest = file_digest(self.file_path)
+        except OSError:
+            # Replaced or locked between stat() and open(); retry on the next poll.
+            self._changed_at = time.monotonic()
+            return False
+        if digest == self.version:
+            return False
+        try:
+            self.on_change(digest)
+        except Exception as ex:
+            # Keep serving the last good version; the next save retries.
+            logger.warning("Reloading %s failed: %s", self.file_path, ex)
+            return False
+        self.version = digest
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                # Never let one bad poll stop auto-refresh for every session.
+                logger.exception("Watching %s failed; will retry", self.file_path)
+
+
+@st.cache_resource
+def get_workbook_watcher(file_path: Path) -> WorkbookWatcher:
+    """
+    One watcher per workbook, shared by every session. On change it warms the
+    load_finance_data cache for the new content, so sessions that pick up the
+    new version hit the cache instead of re-parsing.
+    """
+    def reload(digest: str):
+        load_finance_data(file_path, fx_rates_version(), digest)
+
+    return WorkbookWatcher(file_path, on_change=reload).start()
@@ -0,0 +1,196 @@
+# ---------------------------------------------------------------
+# HEADLESS SNAPSHOT EXPORT
+# ---------------------------------------------------------------
+"""
+Runs the full pipeline once and writes the result to disk, so read-only
+viewers can be served pre-serialized figures instead of re-running pandas,
+Prophet and Plotly on every page view.
+
+    python snapshot.py                      # EXCEL_FILE -> SNAPSHOT_DIR
+    python snapshot.py my.xlsx -o out/ --html
+
+The snapshot directory holds one compact JSON file per figure, kpis.json
+and manifest.json; --html additionally writes a self-contained report.html.
+The app serves the snapshot read-only at ?view=snapshot.
+"""
+import argparse
+import html
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from analytics.forecast import build_monthly_forecast_from_now, load_best_params
+from analytics.metrics import METRIC_FORMATS, get_account_metrics
+from analytics.stats import get_statistics
+from config import EXCEL_FILE, SNAPSHOT_DIR
+from data.loader import fx_rates_version, load_finance_data_with_issues
+from visuals.plots import DASHBOARD_FIGURES, plot_forecast
+
+FORECAST_MONTHS = 9
+
+KPI_LABELS = {
+    "avg_12m": "12-Month Avg Net Worth",
+    "last_month_change": "Last Month Change",
+    "best_month": "Best Month",
+    "worst_month": "Worst Month",
+    "ytd_savings": "YTD Savings",
+    "average_monthly_save": "Avg Savings",
+    "max_value": "Highest Net Worth",
+    "max_date": "Highest Net Worth Date",
+}
+
+
+def _to_jsonable(value):
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if isinstance(value, (tuple, list)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_jsonable(v) for k, v in value.items()}
+    return value
+
+
+def build_snapshot(file_path: Path) -> Dict[str, object]:
+    """
+    Loads the workbook, computes KPIs and every dashboard figure plus the
+    forecast (with the tuned parameters, when the fit succeeds).
+    """
+    df, issues = load_finance_data_with_issues(file_path, fx_rates_version())
+    stats = get_statistics(df)
+    stats["data_issues"] = issues["issue"].value_counts().to_dict()
+    stats["account_metrics"] = get_account_metrics(df).to_dict(orient="index")
+
+    figures: Dict[str, go.Figure] = {name: builder(df) for name, builder in DASHBOARD_FIGURES.items()}
+
+    try:
+        params = load_best_params()
+        _, _, forecast = build_monthly_forecast_from_now(
+            df,
+            months_ahead=FORECAST_MONTHS,
+            regressor_project_method="linear",
+            **params
+        )
+        figures["forecast"] = plot_forecast(df, forecast, FORECAST_MONTHS, backend=params["backend"])
+    except Exception as ex:
+        print(f"Forecasting skipped: {ex}")
+
+    return {"kpis": _to_jsonable(stats), "figures": figures}
+
+
+def write_snapshot(snapshot: Dict[str, object], out_dir: Path, html: bool = False) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    figures: Dict[str, go.Figure] = snapshot["figures"]
+
+    for name, fig in figures.items():
+        # Figures were validated when built; skip re-validation and pretty-printing.
+        (out_dir / f"{name}.json").write_text(pio.to_json(fig, validate=False, pretty=False), encoding="utf-8")
+
+    (out_dir / "kpis.json").write_text(json.dumps(snapshot["kpis"]), encoding="utf-8")
+
+    manifest = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "figures": [f"{name}.json" for name in figures],
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    if html:
+        write_html_report(snapshot, out_dir / "report.html")
+    return out_dir
+
+
+def format_kpi(value) -> str:
+    """Display string for a JSON KPI value from kpis.json."""
+    if value is None:
+        return "–"
+    if isinstance(value, list):  # (amount, date) pairs such as best_month
+        amount, date = value
+        return f"{format_kpi(amount)} ({format_kpi(date)})"
+    if isinstance(value, (int, float)):
+        return f"€{value:,.2f}"
+    return str(value).split("T")[0]  # ISO timestamps -> date
+
+
+def _format_metric(fmt: str):
+    return lambda v: "–" if pd.isna(v) else fmt.format(v)
+
+
+def write_html_report(snapshot: Dict[str, object], out_file: Path) -> Path:
+    """Writes a single self-contained HTML page (plotly.js inlined once)."""
+    kpis = snapshot["kpis"]
+    rows = "".join(
+        f"<tr><th>{html.escape(label)}</th><td>{html.escape(format_kpi(kpis.get(key)))}</td></tr>"
+        for key, label in KPI_LABELS.items()
+    )
+    parts = [
+        "<html><head><meta charset='utf-8'><title>Finance Dashboard</title></head><body>",
+        "<h1>Personal Finance Dashboard</h1>",
+        f"<table>{rows}</table>",
+    ]
+
+    metrics = pd.DataFrame.from_dict(kpis.get("account_metrics", {}), orient="index")
+    if not metrics.empty:
+        formatters = {col: _format_metric(fmt) for col, fmt in METRIC_FORMATS.items() if col in metrics}
+        parts.append("<h2>Per-Account Metrics</h2>")
+        parts.append(metrics.to_html(formatters=formatters, na_rep="–", escape=True))
+
+    issues = kpis.get("data_issues", {})
+    if issues:
+        issue_rows = "".join(
+            f"<tr><th>{html.escape(str(issue))}</th><td>{count}</td></tr>" for issue, count in issues.items()
+        )
+        parts.append(f"<h2>Data Issues</h2><table>{issue_rows}</table>")
+
+    for i, fig in enumerate(snapshot["figures"].values()):
+        parts.append(pio.to_html(fig, full_html=False, include_plotlyjs=(i == 0), validate=False))
+    parts.append("</body></html>")
+    out_file.write_text("\n".join(parts), encoding="utf-8")
+    return out_file
+
+
+def snapshot_version(snapshot_dir: Path = SNAPSHOT_DIR) -> Optional[int]:
+    """Cache key for a snapshot: its manifest's mtime, or None when there is none."""
+    manifest_file = snapshot_dir / "manifest.json"
+    return manifest_file.stat().st_mtime_ns if manifest_file.exists() else None
+
+
+def load_snapshot(snapshot_dir: Path = SNAPSHOT_DIR) -> Optional[Dict[str, object]]:
+    """
+    Reads a snapshot written by write_snapshot, or None if there is none.
+    Figures come back as plain dicts, ready for st.plotly_chart.
+    """
+    manifest_file = snapshot_dir / "manifest.json"
+    if not manifest_file.exists():
+        return None
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    figures = {
+        Path(name).stem: json.loads((snapshot_dir / name).read_text(encoding="utf-8"))
+        for name in manifest["figures"]
+    }
+    kpis = json.loads((snapshot_dir / "kpis.json").read_text(encoding="utf-8"))
+    return {"kpis": kpis, "figures": figures, "generated_at": manifest["generated_at"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a static Finance Dashboard snapshot.")
+    parser.add_argument("excel_file", nargs="?", type=Path, default=EXCEL_FILE)
+    parser.add_argument("-o", "--out-dir", type=Path, default=SNAPSHOT_DIR)
+    parser.add_argument("--html", action="store_true", help="also write a self-contained report.html")
+    args = parser.parse_args(argv)
+
+    snapshot = build_snapshot(args.excel_file)
+    out_dir = write_snapshot(snapshot, args.out_dir, html=args.html)
+    print(f"Snapshot written to {out_dir.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
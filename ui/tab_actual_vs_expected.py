@@ -4,7 +4,7 @@ import plotly.graph_objects as go
 import pandas as pd
 import streamlit as st
 
-def render(df: pd.DataFrame):
+def render(df: pd.DataFrame, stats: dict):
     st.header("📈 Actual vs Expected (Fixed Goal)")
     
     # Fixed goal settings
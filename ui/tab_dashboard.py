@@ -1,10 +1,10 @@
 import pandas as pd
 import streamlit as st
 
-from analytics import stats
-from visuals.plots import plot_cashflow_heatmap, plot_cumulative_savings, plot_monthly_change, plot_net_worth
+from analytics.metrics import METRIC_FORMATS, get_account_metrics
+from visuals.plots import DASHBOARD_FIGURES
 
-def render(df: pd.DataFrame):
+def render(df: pd.DataFrame, stats: dict):
 
     st.subheader("Dashboard Overview")
 
@@ -21,14 +21,32 @@ def render(df: pd.DataFrame):
     col6.metric("Avg Savings", f"€{stats['average_monthly_save']:.2f}")
     col7.metric("Highest Net Worth", f"€{stats['max_value']:,.2f}", stats['max_date'].strftime("%Y-%m-%d"))
 
-    # Charts
-    st.plotly_chart(plot_net_worth(df), use_container_width=True)
-    st.plotly_chart(plot_cumulative_savings(df), use_container_width=True)
-    st.plotly_chart(plot_monthly_change(df), use_container_width=True)
+    # Risk & Growth metrics
+    metrics = get_account_metrics(df)
+    nw = metrics.loc["NetWorth"]
+    col8, col9, col10, col11 = st.columns(4)
+    col8.metric("Max Drawdown", f"{nw['max_drawdown']:.1%}", f"{nw['drawdown_months']:.0f} months", delta_color="off")
+    col9.metric("Volatility (12m)", f"€{nw['volatility']:,.2f}")
+    col10.metric("CAGR", f"{nw['cagr']:.1%}")
+    col11.metric("Positive Streak", f"{nw['current_positive_streak']:.0f} months", f"best {nw['longest_positive_streak']:.0f}", delta_color="off")
+
+    with st.expander("Per-Account Metrics"):
+        st.dataframe(metrics.style.format(METRIC_FORMATS, na_rep="–"))
+
+    # Charts: reserve slots in display order (the heatmap sits under its own
+    # subheader), then emit each chart as soon as it is built.
+    slots = {
+        "net_worth": st.empty(),
+        "cumulative_savings": st.empty(),
+        "monthly_change": st.empty(),
+    }
 
     # Cash Flow Heatmap
     st.subheader("Cash Flow Heatmap")
-    st.plotly_chart(plot_cashflow_heatmap(df), use_container_width=True)
+    slots["cashflow_heatmap"] = st.empty()
+
+    for name, builder in DASHBOARD_FIGURES.items():
+        slots[name].plotly_chart(builder(df), use_container_width=True)
 
     # Raw data
     with st.expander("View Raw Data"):
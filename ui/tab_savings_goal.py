@@ -1,12 +1,12 @@
-import datetime
+from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 
-from analytics.forecast import build_monthly_forecast_from_now
-from config import TREND_COLOR
+from analytics.forecast import build_monthly_forecast_from_now, load_best_params
+from visuals.plots import plot_forecast
 
 # Define color palettes for light/dark mode
 light_palette = {
@@ -30,7 +30,7 @@ try:
 except Exception as e:
     Prophet = None
 
-def render(df: pd.DataFrame):
+def render(df: pd.DataFrame, stats: dict):
 
 
     today = datetime.today()
@@ -131,74 +131,25 @@ def render(df: pd.DataFrame):
     st.markdown(f"**Goal Progress:** {progress_percent*100:.1f}%")
     st.progress(progress_percent)
 
-    # ===== Prophet Forecast with Confidence Bands (12 months ahead) =====
-    st.subheader("Forecast with Confidence Bands (Prophet, 12 months)")
+    # ===== Forecast with Prediction Bands =====
+    # Tuned by `python -m analytics.forecast`, hand-picked defaults otherwise
+    params = load_best_params()
+    months_ahead = 9
+    backend_label = "Prophet" if params["backend"] == "prophet" else "Linear Trend"
+    st.subheader(f"Forecast with Prediction Bands ({backend_label}, {months_ahead} months)")
 
     if Prophet is None:
-        st.error("Prophet is not installed. Please run `pip install prophet` (and cmdstanpy if required). Forecasting is disabled.")
-    else:
-        try:
-            # Build Prophet forecast
-            months_ahead=12
-            m, future, forecast = build_monthly_forecast_from_now(
-                df,
-                months_ahead=9,
-                regressor_project_method="linear",  # instead of "last"
-                n_changepoints=20,
-                changepoint_prior_scale=0.5
-            )
-            # Compose plotly figure
-            forecast_fig = go.Figure()
-
-            # Confidence band from prophet: use yhat_upper and yhat_lower
-            # Only plot forecast portion (futureds) and also show historical for context
-            forecast_ds = pd.to_datetime(forecast['ds'])
-            yhat = forecast['yhat'].values
-            yhat_upper = forecast['yhat_upper'].values
-            yhat_lower = forecast['yhat_lower'].values
-
-            # Add confidence band as filled polygon
-            forecast_fig.add_trace(go.Scatter(
-                x=np.concatenate([forecast_ds, forecast_ds[::-1]]),
-                y=np.concatenate([yhat_upper, yhat_lower[::-1]]),
-                fill='toself',
-                fillcolor='rgba(231,84,128,0.15)',  # light transparent pink-red
-                line=dict(color='rgba(255,255,255,0)'),
-                hoverinfo="skip",
-                showlegend=True,
-                name='95% Confidence Interval'
-            ))
-
-            # Forecast line (pinky-reddish) with markers
-            forecast_fig.add_trace(go.Scatter(
-                x=forecast_ds,
-                y=yhat,
-                mode='lines+markers',
-                name='Prophet Forecast',
-                line=dict(color=TREND_COLOR, width=2),
-                marker=dict(size=6)
-            ))
-
-            # Historical NetWorth (for context)
-            hist = df.dropna(subset=["NetWorth"]).resample('MS').ffill()
-            forecast_fig.add_trace(go.Scatter(
-                x=hist.index,
-                y=hist["NetWorth"],
-                mode='lines+markers',
-                name='Historical Net Worth',
-                line=dict(color='green'),
-                marker=dict(size=6)
-            ))
-
-            forecast_fig.update_layout(
-                title=f"Prophet Forecast (next {months_ahead} months)",
-                yaxis_title="Balance (€)",
-                yaxis_tickprefix="€",
-                hovermode="x unified",
-                legend=dict(y=0.99, x=0.01),
-                margin=dict(t=50)
-            )
-
-            st.plotly_chart(forecast_fig, use_container_width=True)
-        except Exception as ex:
-            st.error(f"Forecasting failed: {ex}")
\ No newline at end of file
+        st.warning("Prophet is not installed. Please run `pip install prophet` (and cmdstanpy if required). Showing a linear trend forecast instead.")
+
+    try:
+        m, future, forecast = build_monthly_forecast_from_now(
+            df,
+            months_ahead=months_ahead,
+            regressor_project_method="linear",  # instead of "last"
+            **params
+        )
+        forecast_fig = plot_forecast(df, forecast, months_ahead, backend=params["backend"])
+
+        st.plotly_chart(forecast_fig, use_container_width=True)
+    except Exception as ex:
+        st.error(f"Forecasting failed: {ex}")
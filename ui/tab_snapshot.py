@@ -0,0 +1,48 @@
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.metrics import METRIC_FORMATS
+from config import SNAPSHOT_DIR
+from snapshot import KPI_LABELS, format_kpi, load_snapshot, snapshot_version
+
+
+@st.cache_resource
+def _load(snapshot_dir: Path, version: Optional[int]):
+    """
+    Loads a snapshot once per version, shared by every viewer. Figures are
+    wrapped in go.Figure without validation: plotly_chart re-validates plain
+    dicts on every view, but passes Figure objects through as they are.
+    """
+    snapshot = load_snapshot(snapshot_dir)
+    if snapshot is not None:
+        snapshot["figures"] = {
+            name: go.Figure(fig, _validate=False) for name, fig in snapshot["figures"].items()
+        }
+    return snapshot
+
+
+def render(snapshot_dir: Path = SNAPSHOT_DIR):
+    """Read-only view of a precomputed snapshot: no pandas or Plotly work per view."""
+    snapshot = _load(snapshot_dir, snapshot_version(snapshot_dir))
+    if snapshot is None:
+        st.warning(f"No snapshot found in `{snapshot_dir}`. Run `python snapshot.py` to create one.")
+        return
+
+    st.caption(f"Snapshot generated at {snapshot['generated_at']}")
+
+    kpis = snapshot["kpis"]
+    cols = st.columns(4)
+    for i, (key, label) in enumerate(KPI_LABELS.items()):
+        cols[i % 4].metric(label, format_kpi(kpis.get(key)))
+
+    metrics = pd.DataFrame.from_dict(kpis.get("account_metrics", {}), orient="index")
+    if not metrics.empty:
+        with st.expander("Per-Account Metrics"):
+            st.dataframe(metrics.style.format(METRIC_FORMATS, na_rep="–"))
+
+    for fig in snapshot["figures"].values():
+        st.plotly_chart(fig, use_container_width=True)
@@ -2,7 +2,9 @@
 # PLOTTING FUNCTIONS
 # ---------------------------------------------------------------
 
-import datetime
+from datetime import datetime
+from typing import Callable, Dict
+
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
@@ -16,21 +18,27 @@ def plot_net_worth(df: pd.DataFrame):
     networth_color = "gold"
     fill_color = "rgba(255, 215, 0, 0.2)"
 
-    fig = go.Figure()
+    # Traces are collected as plain dicts and handed to the figure in one go
+    # with validation skipped: per-property validation of every trace is the
+    # bulk of build time for wide ledgers, and these dicts are known-good.
+    traces = []
 
+    x = df.index.values
     account_cols = [col for col in df.columns if col not in ["NetWorth"] and "_Change" not in col]
     for account in account_cols:
-        fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df[account],
+        traces.append(dict(
+            type="scatter",
+            x=x,
+            y=df[account].values,
             mode='lines+markers',
             name=account,
             marker=dict(size=6)
         ))
 
-    fig.add_trace(go.Scatter(
-        x=df.index,
-        y=df["NetWorth"],
+    traces.append(dict(
+        type="scatter",
+        x=x,
+        y=df["NetWorth"].values,
         mode='lines+markers',
         name="Net Worth",
         line=dict(width=3, color=networth_color),
@@ -52,8 +60,9 @@ def plot_net_worth(df: pd.DataFrame):
         x_all_numeric = np.arange(len(all_dates))
         trend_y = intercept + slope * x_all_numeric
 
-        fig.add_trace(go.Scatter(
-            x=all_dates,
+        traces.append(dict(
+            type="scatter",
+            x=all_dates.values,
             y=trend_y,
             mode='lines+markers',
             name='Trend Line',
@@ -62,6 +71,8 @@ def plot_net_worth(df: pd.DataFrame):
             visible='legendonly'  # <-- hidden by default, user clicks legend to show
         ))
 
+    fig = go.Figure(data=traces, _validate=False)
+
     fig.update_layout(
         title="Net Worth Over Time",
         yaxis_title="Balance (€)",
@@ -74,15 +85,13 @@ def plot_net_worth(df: pd.DataFrame):
 
 
 def plot_monthly_change(df: pd.DataFrame):
-    fig = go.Figure()
     change_cols = [col for col in df.columns if col.endswith("_Change") and col != "NetWorth_Change"]
-    for col in change_cols:
-        account_name = col.replace("_Change", "")
-        fig.add_trace(go.Bar(
-            x=df.index,
-            y=df[col],
-            name=f"{account_name} Change"
-        ))
+    x = df.index.values
+    traces = [
+        dict(type="bar", x=x, y=df[col].values, name=f"{col.replace('_Change', '')} Change")
+        for col in change_cols
+    ]
+    fig = go.Figure(data=traces, _validate=False)
 
     fig.update_layout(
         title="Monthly Change per Account",
@@ -169,6 +178,73 @@ def plot_cumulative_savings(df: pd.DataFrame):
     return fig
 
 
+FORECAST_BACKEND_LABELS = {
+    "prophet": "Prophet Forecast",
+    "linear": "Linear Trend Forecast",
+}
+
+
+def plot_forecast(
+    df: pd.DataFrame,
+    forecast: pd.DataFrame,
+    months_ahead: int = 9,
+    backend: str = "prophet",
+    interval_width: float = 0.95,
+):
+    forecast_fig = go.Figure()
+    label = FORECAST_BACKEND_LABELS.get(backend, "Forecast")
+
+    # Prediction band from the backend: use yhat_upper and yhat_lower
+    # Only plot forecast portion (futureds) and also show historical for context
+    forecast_ds = pd.to_datetime(forecast['ds'])
+    yhat = forecast['yhat'].values
+    yhat_upper = forecast['yhat_upper'].values
+    yhat_lower = forecast['yhat_lower'].values
+
+    # Add confidence band as filled polygon
+    forecast_fig.add_trace(go.Scatter(
+        x=np.concatenate([forecast_ds, forecast_ds[::-1]]),
+        y=np.concatenate([yhat_upper, yhat_lower[::-1]]),
+        fill='toself',
+        fillcolor='rgba(231,84,128,0.15)',  # light transparent pink-red
+        line=dict(color='rgba(255,255,255,0)'),
+        hoverinfo="skip",
+        showlegend=True,
+        name=f'{interval_width:.0%} Prediction Interval'
+    ))
+
+    # Forecast line (pinky-reddish) with markers
+    forecast_fig.add_trace(go.Scatter(
+        x=forecast_ds,
+        y=yhat,
+        mode='lines+markers',
+        name=label,
+        line=dict(color=TREND_COLOR, width=2),
+        marker=dict(size=6)
+    ))
+
+    # Historical NetWorth (for context)
+    hist = df.dropna(subset=["NetWorth"]).resample('MS').ffill()
+    forecast_fig.add_trace(go.Scatter(
+        x=hist.index,
+        y=hist["NetWorth"],
+        mode='lines+markers',
+        name='Historical Net Worth',
+        line=dict(color='green'),
+        marker=dict(size=6)
+    ))
+
+    forecast_fig.update_layout(
+        title=f"{label} (next {months_ahead} months)",
+        yaxis_title="Balance (€)",
+        yaxis_tickprefix="€",
+        hovermode="x unified",
+        legend=dict(y=0.99, x=0.01),
+        margin=dict(t=50)
+    )
+    return forecast_fig
+
+
 def radial_gauge(percent, color, label):
     fig = go.Figure()
 
@@ -198,4 +274,19 @@ def radial_gauge(percent, color, label):
         height=300,
         width=300
     )
-    return fig
\ No newline at end of file
+    return fig
+
+
+# ---------------------------------------------------------------
+# DASHBOARD FIGURES
+# ---------------------------------------------------------------
+
+FigureBuilder = Callable[[pd.DataFrame], go.Figure]
+
+# Dashboard charts by name, shared by the Dashboard tab and the snapshot export.
+DASHBOARD_FIGURES: Dict[str, FigureBuilder] = {
+    "net_worth": plot_net_worth,
+    "cumulative_savings": plot_cumulative_savings,
+    "monthly_change": plot_monthly_change,
+    "cashflow_heatmap": plot_cashflow_heatmap,
+}